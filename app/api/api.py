@@ -1,16 +1,25 @@
 # Native and installed modules
-import flask
+import heapq
 import json
 import jsonschema
-from dicttoxml import dicttoxml
+import orjson
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from jsonschema import validate
 from jsonschema.exceptions import ValidationError
-from flask import Blueprint, jsonify, request, Response
-from sqlalchemy import exc
-from sqlalchemy.orm import contains_eager
-from xml.dom.minidom import parseString
+from flask import Blueprint, jsonify, request
+from lxml import etree
+from sqlalchemy import and_, exc
+from sqlalchemy.orm import (
+    Session,
+    contains_eager,
+    load_only,
+    selectinload,
+)
 
 # Custom modules
+import config
 from model.arrondissement import Arrondissement, ArrondissementModel
 from model.installation_aquatique import (
     InstallationAquatique,
@@ -24,13 +33,72 @@ from schemas.schemas import (
     update_ice_rink_schema,
     update_aquatic_installation_schema,
 )
-from utils.shared import db
-from utils.utils import login_required
+from utils.shared import cache, db
+from utils.utils import (
+    cached_bytes,
+    cached_json,
+    json_response,
+    login_required,
+)
 
 api = Blueprint("api", __name__, url_prefix="/api/v1")
 playground_slide_schema = GlissadeModel()
 aquatic_installation_schema = InstallationAquatiqueModel()
 ice_rink_schema = PatinoireModel()
+playground_slides_schema = GlissadeModel(many=True)
+aquatic_installations_schema = InstallationAquatiqueModel(many=True)
+ice_rinks_schema = PatinoireModel(many=True)
+boroughs_schema = ArrondissementModel(many=True)
+subscriber_schema = SubscriberModel()
+subscribers_schema = SubscriberModel(many=True)
+query_executor = ThreadPoolExecutor(max_workers=3)
+FACILITIES_BATCH_SIZE = 1000
+
+
+def _schema_columns(model, schema):
+    """
+    Return the columns of a model read by its schema, along with its primary
+    and foreign keys so the rows and their nested relationships can be
+    loaded. Building them from the schema keeps the loaded columns in sync
+    with the serialized fields.
+
+    Keyword arguments:
+    model -- The model to load
+    schema -- The schema serializing the model
+
+    Returns:
+    tuple -- The model attributes to pass to load_only
+    """
+    return tuple(
+        getattr(model, column.key)
+        for column in model.__table__.columns
+        if column.key in schema.Meta.fields
+        or column.primary_key
+        or column.foreign_keys
+    )
+
+
+borough_columns = _schema_columns(Arrondissement, ArrondissementModel)
+aquatic_installation_columns = _schema_columns(
+    InstallationAquatique, InstallationAquatiqueModel
+)
+ice_rink_columns = _schema_columns(Patinoire, PatinoireModel)
+playground_slide_columns = _schema_columns(Glissade, GlissadeModel)
+
+SUBSCRIBERS_INSERT_CHUNK_SIZE = 1000
+SUBSCRIBERS_BULK_MAX_ITEMS = 10000
+
+with open(os.path.join(config.BASE_DIR, "schemas/subscribe.json")) as file:
+    subscribe_schema = json.load(file)
+subscribe_validator = jsonschema.Draft202012Validator(subscribe_schema)
+subscribe_bulk_validator = jsonschema.Draft202012Validator(
+    {
+        "type": "array",
+        "minItems": 1,
+        "maxItems": SUBSCRIBERS_BULK_MAX_ITEMS,
+        "items": subscribe_schema,
+    }
+)
 
 
 def _get_json_schema():
@@ -44,17 +112,131 @@ def _get_json_schema():
     return schema
 
 
-def _get_all_facilities():
+def _run_in_sessions(*tasks):
+    """
+    Run independent tasks concurrently, each one in its own session since
+    the Flask-SQLAlchemy session is bound to the request thread.
+
+    Keyword arguments:
+    tasks -- Functions receiving a session and returning a result
+
+    Returns:
+    tuple -- The results of the tasks, in the same order
+    """
+    engine = db.engine
+
+    def run(task):
+        session = Session(bind=engine)
+        try:
+            return task(session)
+        finally:
+            session.close()
+
+    futures = [query_executor.submit(run, task) for task in tasks]
+    return tuple(future.result() for future in futures)
+
+
+def _run_queries(*build_queries):
     """
-    Fetch the facilities in the database and return the list.
+    Run independent queries concurrently, each one in its own session.
+
+    Keyword arguments:
+    build_queries -- Functions receiving a session and returning a query
+
+    Returns:
+    tuple -- The results of the queries, in the same order
+    """
+
+    def fetch_all(build_query):
+        return lambda session: build_query(session).all()
+
+    return _run_in_sessions(*map(fetch_all, build_queries))
+
+
+def _encode_in_batches(query, schema):
+    """
+    Serialize the rows of a query to a json array, one batch at a time, so
+    only a batch of rows and their serialized dicts are held in memory.
+
+    Keyword arguments:
+    query -- The query returning the rows
+    schema -- The schema serializing a list of rows
+
+    Returns:
+    bytes -- The json array
+    """
+    chunks = []
+    batch = []
+    for row in query.yield_per(FACILITIES_BATCH_SIZE):
+        batch.append(row)
+        if len(batch) == FACILITIES_BATCH_SIZE:
+            chunks.append(orjson.dumps(schema.dump(batch))[1:-1])
+            batch = []
+    if batch:
+        chunks.append(orjson.dumps(schema.dump(batch))[1:-1])
+    return b"[" + b",".join(chunks) + b"]"
+
+
+def _encode_all_facilities():
+    """
+    Fetch the facilities in the database and return them as json arrays.
 
     Returns:
     tuple -- The aquatic facilities, the ice rinks, the slides
     """
-    aquatic_facilities = InstallationAquatique.query.all()
-    ice_rinks = Patinoire.query.all()
-    slides = Glissade.query.all()
-    return aquatic_facilities, ice_rinks, slides
+    return _run_in_sessions(
+        lambda session: _encode_in_batches(
+            session.query(InstallationAquatique).options(
+                load_only(*aquatic_installation_columns),
+                selectinload(InstallationAquatique.arrondissement).load_only(
+                    *borough_columns
+                ),
+            ),
+            aquatic_installations_schema,
+        ),
+        lambda session: _encode_in_batches(
+            session.query(Patinoire).options(
+                load_only(*ice_rink_columns),
+                selectinload(Patinoire.arrondissement).load_only(
+                    *borough_columns
+                ),
+            ),
+            ice_rinks_schema,
+        ),
+        lambda session: _encode_in_batches(
+            session.query(Glissade).options(
+                load_only(*playground_slide_columns),
+                selectinload(Glissade.arrondissement).load_only(
+                    *borough_columns
+                ),
+            ),
+            playground_slides_schema,
+        ),
+    )
+
+
+def _join_encoded_facilities(aquatic_facilities, ice_rinks, slides):
+    """
+    Join json arrays of facilities, already encoded, in the json object
+    returned by the installations endpoint.
+
+    Keyword arguments:
+    aquatic_facilities -- The json array of the aquatic facilities
+    ice_rinks -- The json array of the ice rinks
+    slides -- The json array of the slides
+
+    Returns:
+    bytes -- The json object, facilities grouped by type
+    """
+    return (
+        b'{"glissades":'
+        + slides
+        + b',"installations_aquatiques":'
+        + aquatic_facilities
+        + b',"patinoires":'
+        + ice_rinks
+        + b"}"
+    )
 
 
 def _get_facilities_updated_2021():
@@ -65,57 +247,105 @@ def _get_facilities_updated_2021():
     Returns:
     tuple -- The aquatic facilities, the ice rinks, the slides
     """
-    year = "2021"
-
-    slides = (
-        Glissade.query.join(Glissade.arrondissement)
-        .filter(Arrondissement.date_maj.like(year + "%"))
-        .options(contains_eager(Glissade.arrondissement))
-        .order_by(Glissade.nom.asc())
-        .all()
-    )
-    aquatic_facilities = (
-        InstallationAquatique.query.join(InstallationAquatique.arrondissement)
-        .filter(Arrondissement.date_maj.like(year + "%"))
-        .options(contains_eager(InstallationAquatique.arrondissement))
-        .order_by(InstallationAquatique.nom.asc())
-        .all()
+    year = 2021
+    updated_in_year = and_(
+        Arrondissement.date_maj >= datetime(year, 1, 1),
+        Arrondissement.date_maj < datetime(year + 1, 1, 1),
     )
-    skating_rinks = (
-        Patinoire.query.filter(Patinoire.date_heure.contains(year))
-        .order_by(Patinoire.nom.asc())
+
+    borough_ids = [
+        row[0]
+        for row in db.session.query(Arrondissement.id)
+        .filter(updated_in_year)
         .all()
-    )
+    ]
 
-    aquatic_installation_model = InstallationAquatiqueModel(many=True)
-    ice_rink_model = PatinoireModel(many=True)
-    slide_model = GlissadeModel(many=True)
-    serialized_aquatic = aquatic_installation_model.dump(aquatic_facilities)
-    serialized_ice_rinks = ice_rink_model.dump(skating_rinks)
-    serialized_slides = slide_model.dump(slides)
+    aquatic_facilities, skating_rinks, slides = _run_queries(
+        lambda session: session.query(InstallationAquatique)
+        .filter(InstallationAquatique.arrondissement_id.in_(borough_ids))
+        .options(
+            load_only(*aquatic_installation_columns),
+            selectinload(InstallationAquatique.arrondissement).load_only(
+                *borough_columns
+            ),
+        )
+        .order_by(InstallationAquatique.nom.asc()),
+        lambda session: session.query(Patinoire)
+        .filter(
+            and_(
+                Patinoire.date_heure >= str(year),
+                Patinoire.date_heure < str(year + 1),
+            )
+        )
+        .options(
+            load_only(*ice_rink_columns),
+            selectinload(Patinoire.arrondissement).load_only(
+                *borough_columns
+            ),
+        )
+        .order_by(Patinoire.nom.asc()),
+        lambda session: session.query(Glissade)
+        .filter(Glissade.arrondissement_id.in_(borough_ids))
+        .options(
+            load_only(*playground_slide_columns),
+            selectinload(Glissade.arrondissement).load_only(*borough_columns),
+        )
+        .order_by(Glissade.nom.asc()),
+    )
 
-    return serialized_aquatic, serialized_ice_rinks, serialized_slides
+    return aquatic_facilities, skating_rinks, slides
 
 
-def _validate_json(schema_filename, json_data):
+def _serialize_facilities(aquatic_facilities, ice_rinks, slides):
     """
-    Validate json data using a schema.
+    Serialize the facilities, grouped by type, in the format shared by the
+    json and xml responses.
 
     Keyword arguments:
-    schema_filename -- The path of the schema.
-    json_data -- The json data to validate.
+    aquatic_facilities -- The aquatic facilities
+    ice_rinks -- The ice rinks
+    slides -- The slides
 
     Returns:
-    bool -- True if the json data is valid, else false.
+    dict -- The serialized facilities, by type
     """
-    with open(schema_filename, "r") as file:
-        schema = json.load(file)
+    return {
+        "glissades": playground_slides_schema.dump(slides),
+        "installations_aquatiques": aquatic_installations_schema.dump(
+            aquatic_facilities
+        ),
+        "patinoires": ice_rinks_schema.dump(ice_rinks),
+    }
 
-    try:
-        validate(instance=json_data, schema=schema)
-    except jsonschema.exceptions.ValidationError as err:
-        return False
-    return True
+
+def _dicts_to_xml(parent, tag, rows):
+    """
+    Append one element per serialized row to a parent xml element.
+
+    Keyword arguments:
+    parent -- The xml element receiving the rows
+    tag -- The tag of the element created for each row
+    rows -- The list of serialized rows
+    """
+    for row in rows:
+        _dict_to_xml(etree.SubElement(parent, tag), row)
+
+
+def _dict_to_xml(element, data):
+    """
+    Fill an xml element with a child element per key of a serialized row.
+    Nested dicts, like the borough of a facility, become nested elements.
+
+    Keyword arguments:
+    element -- The xml element to fill
+    data -- The serialized row
+    """
+    for key, value in data.items():
+        child = etree.SubElement(element, key)
+        if isinstance(value, dict):
+            _dict_to_xml(child, value)
+        elif value is not None:
+            child.text = str(value)
 
 
 # TODO: not working for now
@@ -189,10 +419,9 @@ def subscribe():
     json -- An error when a problem is detected in the data submitted
     json -- An error when a problem is detected when adding data to database
     """
-    json_schema_path = flask.current_app.root_path + "/schemas/subscribe.json"
     request_data = request.get_json()
 
-    if _validate_json(json_schema_path, request_data):
+    if subscribe_validator.is_valid(request_data):
         subscriber = Subscriber(
             request_data["full_name"],
             request_data["email"],
@@ -202,8 +431,7 @@ def subscribe():
         try:
             db.session.add(subscriber)
             db.session.commit()
-            subscriber_model = SubscriberModel()
-            serialized_subscriber = subscriber_model.dump(subscriber)
+            serialized_subscriber = subscriber_schema.dump(subscriber)
             return jsonify(serialized_subscriber), 201
         except exc.SQLAlchemyError as err:
             return (
@@ -231,7 +459,83 @@ def subscribe():
         )
 
 
+@api.route("/subscribers/bulk", methods=["POST"])
+@login_required
+def subscribe_bulk():
+    """
+    Insert a list of new subscribers in the database, in a single
+    transaction. Reserved to administrators, for imports.
+
+    Keyword arguments:
+    subscribers -- An array of subscribers, each one having a full_name, an
+    email and optionally the boroughs_to_follow
+
+    Returns:
+    json -- The subscribers data when no errors are found
+    json -- An error when a problem is detected in the data submitted
+    json -- An error when a problem is detected when adding data to database
+    """
+    request_data = request.get_json()
+
+    if subscribe_bulk_validator.is_valid(request_data):
+        rows = [
+            {
+                "full_name": subscriber["full_name"],
+                "email": subscriber["email"],
+                "boroughs_to_follow": subscriber.get(
+                    "boroughs_to_follow", []
+                ),
+            }
+            for subscriber in request_data
+        ]
+
+        try:
+            for start in range(0, len(rows), SUBSCRIBERS_INSERT_CHUNK_SIZE):
+                chunk = rows[start:start + SUBSCRIBERS_INSERT_CHUNK_SIZE]
+                db.session.execute(Subscriber.__table__.insert(), chunk)
+            db.session.commit()
+
+            # The sqlite dialect can't return the generated ids from the
+            # inserts, so the subscribers are fetched back by their unique
+            # email.
+            emails = [row["email"] for row in rows]
+            subscribers = []
+            for start in range(0, len(emails), SUBSCRIBERS_INSERT_CHUNK_SIZE):
+                chunk = emails[start:start + SUBSCRIBERS_INSERT_CHUNK_SIZE]
+                subscribers += Subscriber.query.filter(
+                    Subscriber.email.in_(chunk)
+                ).all()
+            subscribers.sort(key=lambda subscriber: subscriber.id)
+            return json_response(subscribers_schema.dump(subscribers), 201)
+        except exc.SQLAlchemyError:
+            db.session.rollback()
+            return (
+                jsonify(
+                    {
+                        "error": {
+                            "message": "Une erreur est survenue lors de "
+                            "l'ajout dans la base de données."
+                        }
+                    }
+                ),
+                500,
+            )
+
+    else:
+        return (
+            jsonify(
+                {
+                    "error": {
+                        "message": "Les données fournies ne sont pas valides."
+                    }
+                }
+            ),
+            400,
+        )
+
+
 @api.route("/arrondissements", methods=["GET"])
+@cached_json(timeout=300)
 def boroughs():
     """
     Fetch the boroughs in the database, then returns the list in json format.
@@ -240,12 +544,12 @@ def boroughs():
     json -- The list of boroughs in json format
     """
     borough_list = Arrondissement.query.all()
-    borough_model = ArrondissementModel(many=True)
-    serialized_boroughs = borough_model.dump(borough_list)
-    return jsonify(serialized_boroughs)
+    serialized_boroughs = boroughs_schema.dump(borough_list)
+    return serialized_boroughs
 
 
 @api.route("/installations", methods=["GET"])
+@cached_bytes(timeout=300, mimetype="application/json")
 def facilities():
     """
     Return the list of facilities in the json format.
@@ -257,36 +561,38 @@ def facilities():
     Returns:
     json -- The list of facilities in JSON format
     """
-    aquatic_facilities, ice_rinks, slides = _get_all_facilities()
     arr_filter = request.args.get("arrondissement")
-    if arr_filter is not None:
-        slides = Glissade.query.filter(
-            Glissade.arrondissement.has(nom=arr_filter)
-        ).all()
-        aquatic_facilities = InstallationAquatique.query.filter(
-            InstallationAquatique.arrondissement.has(nom=arr_filter)
-        ).all()
-        ice_rinks = Patinoire.query.filter(
-            Patinoire.arrondissement.has(nom=arr_filter)
-        ).all()
-
-    aquatic_installation_model = InstallationAquatiqueModel(many=True)
-    ice_rink_model = PatinoireModel(many=True)
-    slide_model = GlissadeModel(many=True)
-    serialized_aquatic = aquatic_installation_model.dump(aquatic_facilities)
-    serialized_ice_rinks = ice_rink_model.dump(ice_rinks)
-    serialized_slides = slide_model.dump(slides)
-
-    return jsonify(
-        {
-            "glissades": serialized_slides,
-            "installations_aquatiques": serialized_aquatic,
-            "patinoires": serialized_ice_rinks,
-        }
+    if arr_filter is None:
+        return _join_encoded_facilities(*_encode_all_facilities())
+
+    slides = (
+        Glissade.query.join(Glissade.arrondissement)
+        .filter(Arrondissement.nom == arr_filter)
+        .options(contains_eager(Glissade.arrondissement))
+        .all()
+    )
+    aquatic_facilities = (
+        InstallationAquatique.query.join(InstallationAquatique.arrondissement)
+        .filter(Arrondissement.nom == arr_filter)
+        .options(contains_eager(InstallationAquatique.arrondissement))
+        .all()
+    )
+    ice_rinks = (
+        Patinoire.query.join(Patinoire.arrondissement)
+        .filter(Arrondissement.nom == arr_filter)
+        .options(contains_eager(Patinoire.arrondissement))
+        .all()
+    )
+
+    return _join_encoded_facilities(
+        orjson.dumps(aquatic_installations_schema.dump(aquatic_facilities)),
+        orjson.dumps(ice_rinks_schema.dump(ice_rinks)),
+        orjson.dumps(playground_slides_schema.dump(slides)),
     )
 
 
 @api.route("/installations-maj-2021", methods=["GET"])
+@cached_json(timeout=3600)
 def facilities_updated_2021():
     """
     Return the list of facilities updated in 2021 in the json format.
@@ -294,17 +600,11 @@ def facilities_updated_2021():
     Returns:
     json -- The list of facilities updated in 2021
     """
-    aquatic_facilities, ice_rinks, slides = _get_facilities_updated_2021()
-    return jsonify(
-        {
-            "glissades": slides,
-            "installations_aquatiques": aquatic_facilities,
-            "patinoires": ice_rinks,
-        }
-    )
+    return _serialize_facilities(*_get_facilities_updated_2021())
 
 
 @api.route("/installations/xml", methods=["GET"])
+@cached_bytes(timeout=3600, mimetype="application/xml")
 def facilities_updated_2021_xml():
     """
     Return the list of facilities updated in 2021 in the xml format.
@@ -312,26 +612,17 @@ def facilities_updated_2021_xml():
     Returns:
     xml -- The list of facilities updated in 2021
     """
-    aquatic_facilities, ice_rinks, slides = _get_facilities_updated_2021()
-    xml_data = [
-        '<?xml version="1.0" encoding="utf-8"?><installations><glissades>',
-        dicttoxml(slides, root=False, attr_type=False).decode("utf-8"),
-        "</glissades><installations_aquatiques>",
-        dicttoxml(aquatic_facilities, root=False, attr_type=False).decode(
-            "utf-8"
-        ),
-        "</installations_aquatiques><patinoires>",
-        dicttoxml(ice_rinks, root=False, attr_type=False).decode("utf-8"),
-        "</patinoires></installations>",
-    ]
-    joined_xml_data = "".join(xml_data)
-    parsed_xml_data = parseString(joined_xml_data)
-    pretty_xml_data = parsed_xml_data.toprettyxml()
-
-    return Response(pretty_xml_data, mimetype="application/xml")
+    facilities = _serialize_facilities(*_get_facilities_updated_2021())
+    root = etree.Element("installations")
+    for tag, rows in facilities.items():
+        _dicts_to_xml(etree.SubElement(root, tag), "item", rows)
+    return etree.tostring(
+        root, pretty_print=True, xml_declaration=True, encoding="utf-8"
+    )
 
 
 @api.route("/installations/names", methods=["GET"])
+@cached_json(timeout=300)
 def facility_names():
     """
     Return the list of facility names in the json format, in alphabetical
@@ -340,20 +631,20 @@ def facility_names():
     Returns:
     json -- The list of facility names in json format
     """
-    aquatic_facilities, ice_rinks, slides = _get_all_facilities()
-    facility_names = []
-    for aquatic_facility in aquatic_facilities:
-        facility_names.append(aquatic_facility.nom)
-    for ice_rink in ice_rinks:
-        facility_names.append(ice_rink.nom)
-    for slide in slides:
-        facility_names.append(slide.nom)
-    sorted_facility_names = sorted(facility_names)
+    sorted_names = _run_queries(
+        lambda session: session.query(InstallationAquatique.nom).order_by(
+            InstallationAquatique.nom
+        ),
+        lambda session: session.query(Patinoire.nom).order_by(Patinoire.nom),
+        lambda session: session.query(Glissade.nom).order_by(Glissade.nom),
+    )
+    facility_names = [row[0] for row in heapq.merge(*sorted_names)]
 
-    return jsonify(sorted_facility_names)
+    return facility_names
 
 
 @api.route("/installations/names/search", methods=["GET"])
+@cached_json(timeout=300)
 def facility_name_search():
     """
     Return the list of facilities in the json format.
@@ -366,27 +657,28 @@ def facility_name_search():
     json -- The list of facilities in json format
     """
     name_filter = request.args.get("nom")
-    if name_filter is not None:
-        slides = Glissade.query.filter(Glissade.nom == name_filter).all()
-        aquatic_facilities = InstallationAquatique.query.filter(
-            InstallationAquatique.nom == name_filter
-        ).all()
-        ice_rinks = Patinoire.query.filter(Patinoire.nom == name_filter).all()
-
-    aquatic_installation_model = InstallationAquatiqueModel(many=True)
-    ice_rink_model = PatinoireModel(many=True)
-    slide_model = GlissadeModel(many=True)
-    serialized_aquatic = aquatic_installation_model.dump(aquatic_facilities)
-    serialized_ice_rinks = ice_rink_model.dump(ice_rinks)
-    serialized_slides = slide_model.dump(slides)
-
-    return jsonify(
-        {
-            "glissades": serialized_slides,
-            "installations_aquatiques": serialized_aquatic,
-            "patinoires": serialized_ice_rinks,
-        }
-    )
+    if name_filter is None:
+        aquatic_facilities, ice_rinks, slides = [], [], []
+    else:
+        slides = (
+            Glissade.query.filter(Glissade.nom == name_filter)
+            .options(selectinload(Glissade.arrondissement))
+            .all()
+        )
+        aquatic_facilities = (
+            InstallationAquatique.query.filter(
+                InstallationAquatique.nom == name_filter
+            )
+            .options(selectinload(InstallationAquatique.arrondissement))
+            .all()
+        )
+        ice_rinks = (
+            Patinoire.query.filter(Patinoire.nom == name_filter)
+            .options(selectinload(Patinoire.arrondissement))
+            .all()
+        )
+
+    return _serialize_facilities(aquatic_facilities, ice_rinks, slides)
 
 
 @api.route("/installations/playground-slides/<id>", methods=["PUT"])
@@ -440,6 +732,7 @@ def update_playground_slide(id):
         playground_slide.deblaye = req["deblaye"]
         playground_slide.condition = req["condition"]
         db.session.commit()
+        cache.clear()
         return playground_slide_schema.jsonify(playground_slide), 200
 
 
@@ -477,6 +770,7 @@ def update_ice_rink(id):
         ice_rink.arrose = request.json["arrose"]
         ice_rink.resurface = request.json["resurface"]
         db.session.commit()
+        cache.clear()
         return ice_rink_schema.jsonify(ice_rink), 200
 
 
@@ -518,6 +812,7 @@ def update_aquatic_installation(id):
         aquatic_installation.gestion = request.json["gestion"]
         aquatic_installation.equipement = request.json["equipement"]
         db.session.commit()
+        cache.clear()
         return aquatic_installation_schema.jsonify(aquatic_installation), 200
 
 
@@ -548,6 +843,7 @@ def delete_playground_slide(id):
         playground_slide = Glissade.query.get(id)
         db.session.delete(playground_slide)
         db.session.commit()
+        cache.clear()
         return playground_slide_schema.jsonify(playground_slide), 204
 
 
@@ -578,6 +874,7 @@ def delete_aquatic_installation(id):
         aquatic_installation = InstallationAquatique.query.get(id)
         db.session.delete(aquatic_installation)
         db.session.commit()
+        cache.clear()
         return aquatic_installation_schema.jsonify(aquatic_installation), 204
 
 
@@ -608,4 +905,5 @@ def delete_ice_rink(id):
         ice_rink = Patinoire.query.get(id)
         db.session.delete(ice_rink)
         db.session.commit()
+        cache.clear()
         return ice_rink_schema.jsonify(ice_rink), 204
@@ -8,7 +8,7 @@ from flask import Flask, render_template, g
 import config
 from api.api import api
 from routes.router import router
-from utils.shared import db
+from utils.shared import cache, db
 from utils.update_database import create_or_update_database
 
 # App configurations
@@ -31,6 +31,7 @@ atexit.register(lambda: update_job.shutdown(wait=False))
 
 # Initialization
 db.init_app(app)
+cache.init_app(app)
 
 # Register blueprints
 app.register_blueprint(api)
@@ -51,6 +52,7 @@ def update_database():
         print(" * UPDATING DATABASE")
         g.LAST_DATABASE_ACTION = "UPDATE"
         create_or_update_database()
+        cache.clear()
         print(" * UPDATE FINISHED")
 
 
@@ -30,6 +30,7 @@ PASSWORD = os.environ.get("PASSWORD")
 class Config(object):
     SQLALCHEMY_DATABASE_URI = "sqlite:///" + DB_PATH
     SQLALCHEMY_TRACK_MODIFICATIONS = True
+    CACHE_TYPE = "SimpleCache"
 
 
 class DevelopmentConfig(Config):
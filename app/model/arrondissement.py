@@ -8,7 +8,7 @@ class Arrondissement(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     nom = db.Column(db.String(128), unique=True, nullable=False)
     cle = db.Column(db.String(64))
-    date_maj = db.Column(db.DateTime)
+    date_maj = db.Column(db.DateTime, index=True)
 
     def __init__(self, id, nom):
         self.id = id
@@ -18,7 +18,8 @@ class Patinoire(db.Model):
         db.Integer, ForeignKey("arrondissement.id"), nullable=False
     )
     arrondissement = relationship("Arrondissement", backref="patinoire")
-    date_heure = db.Column(db.String(19))  # Format is 'YYYY-MM-DD hh:mm:ss'
+    # Format is 'YYYY-MM-DD hh:mm:ss'
+    date_heure = db.Column(db.String(19), index=True)
     ouvert = db.Column(db.Integer)
     deblaye = db.Column(db.Integer)
     arrose = db.Column(db.Integer)
@@ -1,4 +1,5 @@
 # Native and installed modules
+from flask_caching import Cache
 from flask_json_schema import JsonSchema
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
@@ -7,3 +8,4 @@ from flask_marshmallow import Marshmallow
 db = SQLAlchemy()
 ma = Marshmallow()
 schema = JsonSchema()
+cache = Cache()